@@ -33,18 +33,68 @@ Then access it in your Python application:
 
 """
 
-import inspect
+import functools
+import heapq
+import importlib
+import os
 import pathlib
+import re
+import sys
 import warnings
 from os import PathLike
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, Protocol, Tuple, TypeVar, Union, cast
-
-import toml
+from types import FrameType, MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+# TOML parsers with a compatible loads(), from fastest to slowest:
+_TOML_MODULES = (
+    # Optional, written in C++:
+    "pytomlpp",
+    # Standard library in Python 3.11+:
+    "tomllib",
+    # The same as tomllib, but for Python < 3.11:
+    "tomli",
+    # Much slower, but may already be installed:
+    "toml",
+)
 
 # The table in pyproject.toml's [tool.*] namespace:
 PYPROJECT_TABLE_NAME = "project-paths"
 
+# Stack frames from these modules are never considered to be the caller:
+_MODULE_EXCEPTIONS = frozenset(
+    {
+        # Skip over any stack frames in THIS module
+        __name__,
+        # To enable Path(project_root) calls, we need to ignore
+        # stack frames from pathlib
+        pathlib.__name__,
+        # `from project_paths import paths` checks for the attribute from within
+        # importlib before the importing module gets it.
+        "importlib._bootstrap",
+    }
+)
+
+# Parsed paths, keyed by resolved path to pyproject.toml, along with the file's mtime in
+# ns and size when it was parsed:
+_PARSE_CACHE: Dict[str, Tuple[int, int, Mapping[str, str]]] = {}
+# Concrete Paths objects, keyed by path to pyproject.toml:
+_CONCRETE_PATHS: Dict[Path, "_ConcretePaths"] = {}
+# Locations of pyproject.toml, keyed by the directory the search started from:
+_PYPROJECT_LOCATIONS: Dict[str, Path] = {}
+
 # the main export:
 __all__ = ["paths"]
 # Exceptions:
@@ -78,19 +128,23 @@ class PyProjectNotFoundError(ProjectPathsError):
 ####################################### Classes ########################################
 
 
-class Paths(Protocol):
+class Paths:
     """
     Access paths within a parsed pyproject.toml file.
     """
 
+    __slots__ = ()
+
     def __dir__(self) -> List[str]:
-        ...
+        return sorted(object.__dir__(self))
 
     def __getattr__(self, name: str) -> Path:
-        ...
+        # Must raise AttributeError so that hasattr() and getattr(obj, name, default)
+        # keep working for subclasses:
+        raise AttributeError(f"no path named {name!r}")
 
     def __len__(self) -> int:
-        ...
+        raise NotImplementedError
 
 
 ################################### Internal classes ###################################
@@ -103,31 +157,65 @@ class _ConcretePaths(Paths):
     """
     The ACTUAL implementation of Paths. Takes paths from a pyproject.toml,
     parses out the paths and enables access via attributes.
+
+    Path objects are only created when they are first accessed.
     """
 
+    __slots__ = (
+        "_base",
+        "_segments",
+        "_paths",
+        "_lookup",
+        "_path_to_toml",
+        "_dir_cache",
+    )
+
     def __init__(self, path_to_pyproject_toml: PathLike):
-        self._paths = _parse_pyproject_toml(Path(path_to_pyproject_toml))
+        self._base = os.path.dirname(os.fspath(path_to_pyproject_toml))
+        self._segments = _parse_pyproject_toml(Path(path_to_pyproject_toml))
+        self._paths: Dict[str, Path] = {}
+        # The bound method saves looking up .get on every access:
+        self._lookup = self._paths.get
         self._path_to_toml = path_to_pyproject_toml
+        self._dir_cache: Optional[Tuple[str, ...]] = None
 
     def __dir__(self) -> List[str]:
-        return sorted(set(object.__dir__(self)) | self._paths.keys())
+        # The available names never change, so only compute them once:
+        if self._dir_cache is None:
+            # Path names never start with an underscore, so they never clash with this
+            # class's own (dunder or private) attributes; merge both sorted lists:
+            self._dir_cache = tuple(
+                heapq.merge(_CONCRETE_PATHS_DIR, sorted(self._segments))
+            )
+        # Return a copy, so that callers cannot modify the cache:
+        return list(self._dir_cache)
 
     def __getattr__(self, name: str) -> Path:
-        try:
-            return self._paths[name]
-        except KeyError:
-            raise AttributeError(
-                f"no path named {name!r} in {self._path_to_toml}"
-            ) from None
+        # Note: neither dictionary can contain None (TOML has no null), so .get() can
+        # stand in for the more expensive try/except KeyError.
+        path = self._lookup(name)
+        if path is not None:
+            return path
+
+        segment = self._segments.get(name)
+        if segment is None:
+            raise AttributeError(f"no path named {name!r} in {self._path_to_toml}")
+
+        path = self._paths[name] = _make_path(self._base, segment)
+        return path
 
     def __len__(self) -> int:
-        return len(self._paths)
+        return len(self._segments)
 
     def __repr__(self) -> str:
         cls_name = type(self).__qualname__
         return f"{cls_name}({self._path_to_toml!r})"
 
 
+# The attributes of every _ConcretePaths, excluding its paths:
+_CONCRETE_PATHS_DIR = tuple(sorted(dir(_ConcretePaths)))
+
+
 class _Proxy(Generic[T]):
     """
     Proxy calls to regular attributes to the overriden _concrete_instance.
@@ -136,6 +224,9 @@ class _Proxy(Generic[T]):
     subclasses.
     """
 
+    # Proxies have no state of their own:
+    __slots__ = ()
+
     @property
     def _concrete_instance(self) -> T:
         raise NotImplementedError
@@ -164,10 +255,11 @@ class _ProjectRootProxy(_Proxy[Path]):
     every access based on the caller's module.
     """
 
+    __slots__ = ()
+
     @property
     def _concrete_instance(self) -> Path:
-        path_to_pyproject_toml = find_caller_relative_path_to_pyproject()
-        return path_to_pyproject_toml.parent
+        return find_caller_relative_path_to_pyproject().parent
 
     # __dunder__ methods must be EXPLICITLY overridden:
 
@@ -189,14 +281,35 @@ class _ProjectRootProxy(_Proxy[Path]):
 
 class _PathsProxy(_Proxy[Paths]):
     """
-    Acts like a Paths object but creates a concrete Paths object dynamically on every
-    access.
+    Acts like a Paths object but creates a concrete Paths object dynamically based on
+    the caller's module.
+
+    Module-level access to `paths` only hands out this proxy when the caller's paths
+    cannot be determined ahead of time (e.g., from the interactive prompt), or when
+    loading them failed, so that the error is raised when the paths are used.
     """
 
+    __slots__ = ()
+
     @property
     def _concrete_instance(self) -> Paths:
-        path_to_pyproject_toml = find_caller_relative_path_to_pyproject()
-        return _ConcretePaths(path_to_pyproject_toml)
+        return _paths_for_pyproject(find_caller_relative_path_to_pyproject())
+
+    def __getattr__(self, name: str) -> Path:
+        if name.startswith("_"):
+            # Names with a leading underscore are never paths. Introspection (e.g.,
+            # inspect, pydoc, IPython) probes lots of these, so fail fast without
+            # finding the caller's concrete Paths object.
+            raise AttributeError(
+                f"{type(self).__qualname__!r} object has no attribute {name!r}"
+            )
+
+        concrete = cast(_ConcretePaths, self._concrete_instance)
+        # Skip the concrete instance's __getattr__ for already created paths:
+        path = concrete._lookup(name)
+        if path is not None:
+            return path
+        return getattr(concrete, name)
 
     def __len__(self) -> int:
         return len(self._concrete_instance)
@@ -205,10 +318,55 @@ class _PathsProxy(_Proxy[Paths]):
 ##################################### External API #####################################
 
 
-# The proxy intercepts attribute access and uses an appropriate concrete Paths object to
-# provide the correct paths to the caller.
-paths: Paths = _PathsProxy.as_proxied_type()
-project_root: Path = _ProjectRootProxy.as_proxied_type()
+# Note: `paths` and `project_root` are provided by the module-level __getattr__()
+# below, which returns the appropriate concrete object for the importing module:
+paths: Paths
+project_root: Path
+
+# When the concrete object cannot be determined ahead of time, these proxies intercept
+# attribute access and use the appropriate concrete object on every access:
+_paths_proxy: Paths = _PathsProxy.as_proxied_type()
+_project_root_proxy: Path = _ProjectRootProxy.as_proxied_type()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Provides `paths` and `project_root` for the calling module.
+    See: https://www.python.org/dev/peps/pep-0562/
+    """
+    proxy: Any
+    if name == "paths":
+        proxy = _paths_proxy
+    elif name == "project_root":
+        proxy = _project_root_proxy
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if sys._getframe(1).f_code.co_name != "<module>":
+        # Only module-level code, e.g., `from project_paths import paths` while importing
+        # a module, gets the concrete object. Other callers, like monkeypatch.setattr(),
+        # may store what they get where other modules will use it.
+        return proxy
+
+    try:
+        filename = _caller_filename(*_find_caller_module_name_and_file())
+        if filename is None:
+            # Depends on the current working directory, which may change at any time.
+            return proxy
+
+        path_to_pyproject_toml = _find_pyproject_for_file(filename)
+        if name == "paths":
+            return _paths_for_pyproject(path_to_pyproject_toml)
+        return path_to_pyproject_toml.parent
+    except Exception:
+        # Defer the error until the proxy is actually used. This includes invalid TOML
+        # and warnings turned into errors (e.g., with -W error), so that merely
+        # importing paths never fails.
+        return proxy
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), "paths", "project_root"])
 
 
 def find_caller_relative_path_to_pyproject() -> Path:
@@ -216,23 +374,59 @@ def find_caller_relative_path_to_pyproject() -> Path:
     Tries to find the pyproject.toml relative to the caller of this module.
     """
 
-    mod_name, caller_filename = _find_caller_module_name_and_file()
+    caller_filename = _caller_filename(*_find_caller_module_name_and_file())
+    if caller_filename is None:
+        return _find_pyproject_by_parent_traversal(Path.cwd())
+    return _find_pyproject_for_file(caller_filename)
+
+
+################################## Internal functions ##################################
+
+
+def _find_caller_module_name_and_file() -> Tuple[str, Optional[str]]:
+    """
+    Returns the module name of the first caller in the stack that DOESN'T from from this
+    module -- namely, project_paths.
+    """
+
+    # Note: sys._getframe() is MUCH cheaper than inspect.stack(), which fetches source
+    # code context for every frame in the stack.
+    frame: Optional[FrameType] = sys._getframe(1)
+    try:
+        # Crawl up the stack until we no longer find a caller in THIS module or any
+        # excluded module (e.g., ignore calls within pathlib)
+        while frame is not None:
+            caller_globals = frame.f_globals
+            mod_name = caller_globals.get("__name__")
+            if mod_name not in _MODULE_EXCEPTIONS:
+                return cast(str, mod_name), caller_globals.get("__file__")
+            frame = frame.f_back
+        raise RuntimeError(f"cannot find any caller outside of {__name__}")
+    finally:
+        # Remove a reference cycle caused due to holding the frame
+        # See: https://docs.python.org/3/library/inspect.html#the-interpreter-stack
+        del frame
+
+
+def _caller_filename(mod_name: str, filename: Optional[str]) -> Optional[str]:
+    """
+    Returns the filename from which to find the caller's pyproject.toml, or None if it
+    should be found relative to the current working directory instead.
+    """
 
     if mod_name in ("inspect", "pydoc"):
         # inspect.getmembers() might be calling us, or maybe pydoc.
         # this makes things confusing, so just use the current working dir.
         # TODO: assert that these are the built-in modules!
-        return _find_pyproject_by_parent_traversal(Path.cwd())
+        return None
 
-    if isinstance(caller_filename, str):
-        working_file = Path(caller_filename)
-        assert working_file.is_file()
-        return _find_pyproject_by_parent_traversal(working_file.parent)
+    if isinstance(filename, str):
+        return filename
 
     if mod_name == "__main__":
         # No filename but the mod name is __main__? Assume this is an interactive
         # prompt; thus load from the current working directory
-        return _find_pyproject_by_parent_traversal(Path.cwd())
+        return None
 
     # cannot determine filename AAAANNDD mod_name is not __main__????
     raise PyProjectNotFoundError(
@@ -240,93 +434,243 @@ def find_caller_relative_path_to_pyproject() -> Path:
     )
 
 
-################################## Internal functions ##################################
-
-
-def _find_caller_module_name_and_file() -> Tuple[str, Optional[str]]:
+def _paths_for_pyproject(path_to_pyproject_toml: Path) -> Paths:
     """
-    Returns the module name of the first caller in the stack that DOESN'T from from this
-    module -- namely, project_paths.
+    Returns the concrete Paths object for the given pyproject.toml. Only one Paths
+    object is created per pyproject.toml, and it is shared by all of its modules, until
+    the pyproject.toml changes.
     """
+    # Checks whether the file changed (see _PARSE_CACHE):
+    segments = _parse_pyproject_toml(path_to_pyproject_toml)
 
-    MODULE_EXCEPTIONS = (
-        # Skip over any stack frames in THIS module
-        __name__,
-        # To enable Path(project_root) calls, we need to ignore
-        # stack frames from pathlib
-        pathlib.__name__,
-    )
+    instance = _CONCRETE_PATHS.get(path_to_pyproject_toml)
+    if instance is None or instance._segments is not segments:
+        instance = _CONCRETE_PATHS[path_to_pyproject_toml] = _ConcretePaths(
+            path_to_pyproject_toml
+        )
+    return instance
 
-    try:
-        # Crawl up the stack until we no longer find a caller in THIS module or any
-        # excluded module (e.g., ignore calls within pathlib)
-        for frame_info in inspect.stack():
-            mod_name = frame_info.frame.f_globals.get("__name__")
-            if mod_name not in MODULE_EXCEPTIONS:
-                assert isinstance(mod_name, str)
-                filename = frame_info.frame.f_globals.get("__file__")
-                return mod_name, filename
-        raise RuntimeError(f"cannot find any caller outside of {__name__}")
-    finally:
-        # Remove a reference cycle caused due to holding frame_info.frame
-        # See: https://docs.python.org/3/library/inspect.html#the-interpreter-stack
-        del frame_info
 
+def _find_pyproject_for_file(filename: str) -> Path:
+    """
+    Returns the path to the pyproject.toml that applies to the given source file.
+    """
+    return _find_pyproject_by_parent_traversal(os.path.dirname(filename))
 
-def _find_pyproject_by_parent_traversal(base: Path) -> Path:
+
+def _find_pyproject_by_parent_traversal(base: Union[str, Path]) -> Path:
     """
     Returns the path to pyproject.toml relative to the given base path.
     Traverses BACKWARDS starting from the base and going out of the parents.
+
+    Results are cached per base path, and searched for again if the pyproject.toml is
+    no longer there; use _clear_caches() to forget them.
+    """
+    key = os.fspath(base)
+    cached = _PYPROJECT_LOCATIONS.get(key)
+    if cached is not None:
+        if os.path.isfile(cached):
+            return cached
+        # Deleted or replaced since it was found:
+        del _PYPROJECT_LOCATIONS[key]
+
+    path = _search_parents_for_pyproject(key)
+    _PYPROJECT_LOCATIONS[key] = path
+    return path
+
+
+def _search_parents_for_pyproject(base: str) -> Path:
+    """
+    Uncached version of _find_pyproject_by_parent_traversal().
     """
-    for directory in [base, *base.resolve().parents]:
-        candidate = directory / "pyproject.toml"
-        if candidate.is_file():
-            return candidate
+    candidate = os.path.join(base, "pyproject.toml")
+    if os.path.isfile(candidate):
+        return Path(candidate)
+
+    # Search the parents of the RESOLVED base, so that a symlinked directory finds the
+    # pyproject.toml of the project it actually lives in. Work with plain strings;
+    # Path objects are relatively expensive to create, and most directories will NOT
+    # have a pyproject.toml.
+    directory = os.path.realpath(base)
+    while True:
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            # Reached the root
+            break
+        directory = parent
+
+        candidate = os.path.join(directory, "pyproject.toml")
+        if os.path.isfile(candidate):
+            return Path(candidate)
 
     raise PyProjectNotFoundError(
         f"cannot find pyproject.toml within {base} or any of its parents"
     )
 
 
-def _make_path(base: Path, segment: str) -> Path:
+def _make_path(base: str, segment: str) -> Path:
     """
     Returns the segment relative to the given base, if it's a relative path
     Absolute paths are returned as is.
     """
-    original_path = Path(segment)
-    if original_path.is_absolute():
-        return original_path
+    # Work with strings, so that only one Path is ever created. Note that joining with
+    # an absolute segment returns the segment itself:
+    return Path(os.path.join(base, segment))
 
-    return base.joinpath(original_path)
 
+@functools.lru_cache(maxsize=None)
+def _resolve(path: Path) -> Path:
+    """
+    Returns the resolved path. Resolving requires a system call for every component of
+    the path, so results are cached.
+    """
+    return path.resolve()
 
-def _parse_pyproject_toml(pyproject_path: Path) -> Dict[str, Path]:
+
+def _import_toml_loads() -> Callable[[str], Dict[str, Any]]:
+    """
+    Returns loads() from the fastest TOML parser available.
     """
-    Given a pyproject.toml, parses its texts and returns a dictionary of valid paths.
+    for module_name in _TOML_MODULES:
+        try:
+            return importlib.import_module(module_name).loads
+        except ImportError:
+            continue
+    raise ImportError(f"cannot import any of {', '.join(_TOML_MODULES)}")
+
+
+_loads_toml = _import_toml_loads()
+
+
+# Patterns used by _scan_table():
+_TABLE_NAME = re.escape(PYPROJECT_TABLE_NAME.encode("UTF-8"))
+# Anything that might be (or be part of) the table:
+_TABLE_CANDIDATE = re.compile(
+    rb"""^[ \t]*(?:\[+[ \t]*)?(?:["']?tool["']?[ \t]*\.[ \t]*)?["']?""" + _TABLE_NAME,
+    re.MULTILINE,
+)
+_TABLE_HEADER = re.compile(
+    rb"^\[tool\." + _TABLE_NAME + rb"\][ \t]*(?:#[^\r\n]*)?\r?$", re.MULTILINE
+)
+_TABLE_END = re.compile(rb"^[ \t]*\[", re.MULTILINE)
+# Either key = "basic string" (without escapes) or key = 'literal string':
+_KEY_VALUE = re.compile(
+    rb"""[ \t]*([A-Za-z0-9_-]+)[ \t]*=[ \t]*"""
+    rb"""(?:"([^"\\\r\n]*)"|'([^'\r\n]*)')[ \t]*(?:#.*)?"""
+)
+_BLANK_OR_COMMENT = re.compile(rb"[ \t]*(?:#.*)?")
+# Control characters are not allowed anywhere in TOML (apart from tab, and CR in CRLF):
+_CONTROL_CHARACTER = re.compile(rb"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]|\r(?!\n)")
+
+
+def _scan_table(data: bytes) -> Optional[Dict[str, str]]:
     """
-    with pyproject_path.open() as toml_file:
-        pyproject = toml.load(toml_file)
+    Scans the [tool.project-paths] table out of the raw contents of a pyproject.toml,
+    without parsing the rest of the file.
 
-    try:
-        config = pyproject["tool"][PYPROJECT_TABLE_NAME]
-    except KeyError:
-        raise ConfigurationNotFoundError(
-            f"cannot find [tool.{PYPROJECT_TABLE_NAME}]"
-            f" within {pyproject_path.resolve()}"
-        )
+    This only understands the simplest (and most common) way to write the table:
+    a single [tool.project-paths] header followed by lines of key = "string".
+    Returns None if the table cannot be found or contains anything else, in which
+    case the entire file should be parsed instead.
+
+    Note: the rest of the file is NOT validated, so syntax errors outside of the table
+    (that a TOML parser would reject) go unnoticed when the table can be scanned.
+    """
+    if b'"""' in data or b"'''" in data:
+        # Multi-line strings may contain anything, including fake table headers.
+        return None
+
+    if _CONTROL_CHARACTER.search(data):
+        # Invalid TOML; let the parser complain about it.
+        return None
+
+    candidates = _TABLE_CANDIDATE.findall(data)
+    if len(candidates) != 1:
+        return None
+
+    header = _TABLE_HEADER.search(data)
+    if header is None:
+        return None
+
+    end = _TABLE_END.search(data, header.end())
+    table = data[header.end() : end.start() if end else len(data)]
+
+    config: Dict[str, str] = {}
+    for line in table.splitlines():
+        match = _KEY_VALUE.fullmatch(line)
+        if match is None:
+            if _BLANK_OR_COMMENT.fullmatch(line):
+                continue
+            return None
 
-    base = pyproject_path.parent
-    assert base.is_dir()
+        key, basic_string, literal_string = match.groups()
+        name = key.decode("UTF-8")
+        if name in config:
+            # Duplicate keys are invalid; let the parser complain about it.
+            return None
+        value = basic_string if basic_string is not None else literal_string
+        config[name] = value.decode("UTF-8")
 
-    paths = {}
-    for name, path_str in config.items():
+    return config
+
+
+def _parse_pyproject_toml(pyproject_path: Path) -> Mapping[str, str]:
+    """
+    Given a pyproject.toml, parses its texts and returns a dictionary of valid path
+    names to their unprocessed path strings.
+
+    Results are cached until the file's modification time or size changes, and are
+    read-only, since they are shared.
+    """
+    try:
+        stat = os.stat(pyproject_path)
+        key = str(_resolve(pyproject_path))
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            mtime_ns, size, result = cached
+            if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+                return result
+
+        data = pyproject_path.read_bytes()
+    except OSError as error:
+        # e.g., deleted, or replaced by a directory since it was found
+        raise PyProjectNotFoundError(f"cannot read {pyproject_path}: {error}")
+
+    config = _scan_table(data)
+    if config is None:
+        # Could not scan the table; parse the entire file instead.
+        pyproject = _loads_toml(data.decode("UTF-8"))
+        try:
+            config = pyproject["tool"][PYPROJECT_TABLE_NAME]
+        except KeyError:
+            raise ConfigurationNotFoundError(
+                f"cannot find [tool.{PYPROJECT_TABLE_NAME}]"
+                f" within {_resolve(pyproject_path)}"
+            )
+
+    # Reserved names are discarded:
+    for name in config:
         if name.startswith("_"):
-            # discard reserved name
             warnings.warn(
                 UserWarning(f"{name} is inaccessible due to leading underscore")
             )
-            continue
 
-        paths[name] = _make_path(base, path_str)
+    paths = {
+        name: path_str for name, path_str in config.items() if not name.startswith("_")
+    }
+
+    result = MappingProxyType(paths)
+    # Replaces any outdated entry, so that only one is kept per file:
+    _PARSE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
 
-    return paths
+
+def _clear_caches() -> None:
+    """
+    Forgets all cached pyproject.toml locations and parsed paths.
+    Useful when pyproject.toml files are created or moved during tests.
+    """
+    _PYPROJECT_LOCATIONS.clear()
+    _resolve.cache_clear()
+    _PARSE_CACHE.clear()
+    _CONCRETE_PATHS.clear()
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+import pytest
+
+import project_paths
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Every test should start without anything cached from previous tests.
+    """
+    project_paths._clear_caches()
@@ -3,6 +3,8 @@
 
 import pytest
 
+import project_paths
+
 
 def test_loading_problematic_names():
     """
@@ -10,6 +12,11 @@ def test_loading_problematic_names():
     present in the pyproject.toml file. There should be a warning in this case!
     """
 
+    # The warning is only issued when the file is first parsed. This directory has its
+    # own pyproject.toml, so when run by itself, pytest does not load ../conftest.py,
+    # which would otherwise clear the caches:
+    project_paths._clear_caches()
+
     with pytest.warns(UserWarning, match="_paths"):
         from project_paths import paths
 
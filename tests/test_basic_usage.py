@@ -66,6 +66,40 @@ def test_project_root_can_be_converted_to_bytes():
     assert bytes(project_root) == bytes(Path(os.fspath(project_root)))
 
 
+@pytest.mark.skipif(os.name != "posix", reason="bytes(Path()) only recommended on Unix")
+def test_project_root_from_interactive_prompt(tmp_path, monkeypatch):
+    """
+    The interactive prompt has no __file__, so it gets a proxy for the project root
+    of the current working directory.
+    """
+    (tmp_path / "pyproject.toml").write_text("[tool.project-paths]\n")
+    monkeypatch.chdir(tmp_path)
+
+    program = """
+import os
+from pathlib import Path
+from project_paths import project_root
+
+results = {
+    "/": project_root / "pyproject.toml",
+    "fspath": os.fspath(project_root),
+    "str": str(project_root),
+    "bytes": bytes(project_root),
+    "Path": Path(project_root),
+}
+"""
+    namespace = {"__name__": "__main__"}
+    exec(program, namespace)
+
+    assert isinstance(namespace["project_root"], project_paths._ProjectRootProxy)
+    results = namespace["results"]
+    assert results["/"] == tmp_path / "pyproject.toml"
+    assert results["fspath"] == os.fspath(tmp_path)
+    assert results["str"] == str(tmp_path)
+    assert results["bytes"] == bytes(tmp_path)
+    assert results["Path"] == tmp_path
+
+
 def test_len():
     assert len(paths) >= len(EXPECTED_PATHS)
 
@@ -84,3 +118,18 @@ def test_path_does_not_exist():
     assert "does_not_exist" in str(exc_info.value)
     path_str = str(find_caller_relative_path_to_pyproject())
     assert path_str in str(exc_info.value)
+
+
+def test_paths_subclass():
+    """
+    Paths without a path should behave like any object without an attribute.
+    """
+
+    class NoPaths(project_paths.Paths):
+        def __len__(self) -> int:
+            return 0
+
+    no_paths = NoPaths()
+    assert not hasattr(no_paths, "tests")
+    assert getattr(no_paths, "tests", None) is None
+    assert "tests" not in dir(no_paths)
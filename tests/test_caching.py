@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Note: these tests know about the internal structure of the module.
+"""
+
+from pathlib import Path
+
+import pytest
+
+import project_paths
+
+
+def import_as_module(*names):
+    """
+    Returns what module-level code in this file gets from `from project_paths import`.
+    """
+    namespace = {"__name__": "example", "__file__": __file__}
+    exec(f"from project_paths import {', '.join(names)}", namespace)
+    return tuple(namespace[name] for name in names)
+
+
+def test_parse_is_cached(tmp_path):
+    """
+    Parsing the same, unchanged pyproject.toml should not parse it again.
+    """
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.project-paths]\ndocs = "docs/"\n')
+
+    first = project_paths._parse_pyproject_toml(pyproject)
+    second = project_paths._parse_pyproject_toml(pyproject)
+    assert first is second
+    assert first["docs"] == "docs/"
+
+    with pytest.raises(TypeError):
+        first["docs"] = "elsewhere/"  # type: ignore
+
+
+def test_parse_cache_invalidated_on_change(tmp_path):
+    """
+    Changing the pyproject.toml should be noticed.
+    """
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.project-paths]\ndocs = "docs/"\n')
+    assert "readme" not in project_paths._parse_pyproject_toml(pyproject)
+
+    pyproject.write_text('[tool.project-paths]\ndocs = "docs/"\nreadme = "README"\n')
+    assert "readme" in project_paths._parse_pyproject_toml(pyproject)
+
+
+def test_paths_reused_within_module():
+    """
+    Accessing paths from the same module should reuse the same concrete Paths object.
+    """
+    (first,) = import_as_module("paths")
+    (second,) = import_as_module("paths")
+    assert isinstance(first, project_paths._ConcretePaths)
+    assert first is second
+
+
+def test_paths_proxied_outside_module_level_code(monkeypatch):
+    """
+    Only module-level code should get the concrete Paths object; anything else might
+    keep it where other modules will use it.
+    """
+    assert isinstance(project_paths.paths, project_paths._PathsProxy)
+
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(project_paths, "paths", None)
+        # Undoing the patch made the proxy a real attribute of the module:
+        assert isinstance(vars(project_paths)["paths"], project_paths._PathsProxy)
+    finally:
+        vars(project_paths).pop("paths", None)
+
+
+def test_proxy_reuses_concrete_paths():
+    proxy = project_paths._PathsProxy()
+    assert proxy._concrete_instance is proxy._concrete_instance
+
+
+def test_proxy_rejects_reserved_names():
+    proxy = project_paths._PathsProxy()
+    assert not hasattr(proxy, "_ipython_canary_method_should_not_exist_")
+    assert not hasattr(proxy, "__wrapped__")
+
+
+def test_paths_are_created_once(tmp_path):
+    """
+    Path objects should only be created once, on first access.
+    """
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.project-paths]\ndocs = "docs/"\n')
+    paths = project_paths._ConcretePaths(pyproject)
+
+    assert paths._paths == {}
+    assert paths.docs == tmp_path / "docs"
+    assert paths.docs is paths.docs
+
+
+def test_clear_caches(tmp_path):
+    """
+    A pyproject.toml created after a failed lookup should be found after clearing
+    the caches.
+    """
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    pyproject = nested / "pyproject.toml"
+    pyproject.write_text("")
+    assert project_paths._find_pyproject_by_parent_traversal(nested) == pyproject
+
+    closer = nested / "closer"
+    closer.mkdir()
+    assert project_paths._find_pyproject_by_parent_traversal(closer) == pyproject
+    (closer / "pyproject.toml").write_text("")
+    assert project_paths._find_pyproject_by_parent_traversal(closer) == pyproject
+
+    project_paths._clear_caches()
+    assert (
+        project_paths._find_pyproject_by_parent_traversal(closer)
+        == closer / "pyproject.toml"
+    )
+
+
+def test_find_pyproject_through_symlink(tmp_path):
+    """
+    A symlinked directory should find the pyproject.toml of the directory it links to.
+    """
+    project = tmp_path / "real" / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "pyproject.toml").write_text("")
+    (tmp_path / "other").mkdir()
+    link = tmp_path / "other" / "link"
+    link.symlink_to(project / "src", target_is_directory=True)
+
+    found = project_paths._find_pyproject_by_parent_traversal(link)
+    assert found.samefile(project / "pyproject.toml")
+
+
+def test_paths_shared_by_pyproject():
+    """
+    Modules sharing the same pyproject.toml should share the same Paths object.
+    """
+    toml_path = project_paths.find_caller_relative_path_to_pyproject()
+    (paths,) = import_as_module("paths")
+    assert project_paths._paths_for_pyproject(toml_path) is paths
+
+
+def test_changes_seen_from_interactive_prompt(tmp_path, monkeypatch):
+    """
+    Paths accessed from the interactive prompt should notice changes to the
+    pyproject.toml in the current working directory.
+    """
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.project-paths]\na = "a"\n')
+    monkeypatch.chdir(tmp_path)
+
+    # Like the interactive prompt, this has no __file__:
+    program = "import project_paths\npath = project_paths.paths.{name}"
+    namespace = {"__name__": "__main__"}
+    exec(program.format(name="a"), namespace)
+    assert namespace["path"] == tmp_path / "a"
+
+    pyproject.write_text('[tool.project-paths]\na = "a"\nb = "bbbb"\n')
+    exec(program.format(name="b"), namespace)
+    assert namespace["path"] == tmp_path / "bbbb"
+
+
+def test_project_root_is_a_path():
+    """
+    Accessing the project root from a module should give a real Path.
+    """
+    toml_path = project_paths.find_caller_relative_path_to_pyproject()
+    (project_root,) = import_as_module("project_root")
+    assert isinstance(project_root, Path)
+    assert project_root == toml_path.parent
+
+
+def test_deleted_pyproject_is_searched_for_again(tmp_path, monkeypatch):
+    """
+    A cached pyproject.toml that is deleted or replaced should not be used anymore.
+    """
+    project = tmp_path / "project"
+    project.mkdir()
+    pyproject = project / "pyproject.toml"
+    pyproject.write_text('[tool.project-paths]\na = "a"\n')
+    monkeypatch.chdir(project)
+
+    # Like the interactive prompt, this has no __file__:
+    program = "import project_paths\npath = project_paths.paths.a"
+    namespace = {"__name__": "__main__"}
+    exec(program, namespace)
+    assert namespace["path"] == project / "a"
+
+    pyproject.unlink()
+    with pytest.raises(project_paths.PyProjectNotFoundError):
+        exec(program, namespace)
+
+    pyproject.mkdir()
+    with pytest.raises(project_paths.PyProjectNotFoundError):
+        exec(program, namespace)
+
+    pyproject.rmdir()
+    (tmp_path / "pyproject.toml").write_text('[tool.project-paths]\na = "aaaa"\n')
+    exec(program, namespace)
+    assert namespace["path"] == tmp_path / "aaaa"
+
+
+def test_unreadable_pyproject(tmp_path):
+    """
+    Failing to read the pyproject.toml should raise an error from this module.
+    """
+    with pytest.raises(project_paths.PyProjectNotFoundError):
+        project_paths._parse_pyproject_toml(tmp_path / "pyproject.toml")
+
+
+def test_parse_cache_keeps_one_entry_per_file(tmp_path):
+    """
+    Editing the pyproject.toml should replace its cached entry, not add another.
+    """
+    pyproject = tmp_path / "pyproject.toml"
+    for i in range(3):
+        pyproject.write_text(f'[tool.project-paths]\ndocs = "{"d" * (i + 1)}"\n')
+        assert project_paths._parse_pyproject_toml(pyproject)["docs"] == "d" * (i + 1)
+
+    assert len(project_paths._PARSE_CACHE) == 1
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: UTF-8 -*-
 
+import warnings
+
 import pytest
 
 import project_paths
@@ -22,3 +24,39 @@ def test_dir() -> None:
 
     assert "paths" in directory
     assert directory == sorted(directory), "dir(mod) must be sorted"
+
+
+def _toml_decode_error() -> type:
+    """
+    Returns the exception raised by the TOML parser in use for invalid TOML.
+    """
+    try:
+        project_paths._loads_toml("b = [\n")
+    except Exception as error:
+        return type(error)
+    raise AssertionError("expected invalid TOML")
+
+
+@pytest.mark.parametrize(
+    "contents,expected",
+    [
+        # Invalid TOML:
+        ("[tool.project-paths]\nb = [\n", _toml_decode_error()),
+        # Reserved name, when warnings are errors:
+        ('[tool.project-paths]\n_x = "x"\n', UserWarning),
+    ],
+)
+def test_import_defers_errors(tmp_path, contents, expected) -> None:
+    """
+    Importing paths should not fail; the error should happen when the paths are used.
+    """
+    (tmp_path / "pyproject.toml").write_text(contents)
+    namespace = {"__name__": "example", "__file__": str(tmp_path / "example.py")}
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        exec("from project_paths import paths, project_root", namespace)
+        assert isinstance(namespace["paths"], project_paths._PathsProxy)
+
+        with pytest.raises(expected):
+            exec("paths.x", namespace)
@@ -20,7 +20,7 @@ def test_proxy_repr():
     """"""
     toml_path = project_paths.find_caller_relative_path_to_pyproject()
     concrete_paths = project_paths._ConcretePaths(toml_path)
-    paths_proxy = project_paths.paths
+    paths_proxy = project_paths._PathsProxy()
 
     assert type(paths_proxy).__qualname__ in repr(paths_proxy)
     assert repr(concrete_paths) in repr(paths_proxy)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Note: these tests know about the internal structure of the module.
+"""
+
+import sys
+
+import pytest
+
+import project_paths
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[tool.project-paths]\ndocs = "docs/"\n',
+        '[tool.project-paths]\r\ndocs = "docs/"\r\nabsolute = "/opt"\r\n',
+        "[tool.project-paths] # comment\n\n# comment\ndocs = 'C:\\docs' # comment\n",
+        '[tool.poetry]\nname = "project-paths"\n\n'
+        '[tool.project-paths]\ntests = "tests/"\n\n'
+        '[build-system]\nrequires = ["poetry-core"]\n',
+        "[tool.project-paths]\n",
+    ],
+)
+def test_scan_table(text):
+    """
+    Simple tables should give the same result as parsing the whole file.
+    """
+    data = text.encode("UTF-8")
+    expected = tomllib.loads(text)["tool"]["project-paths"]
+    assert project_paths._scan_table(data) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # No table at all:
+        '[tool.poetry]\nname = "project-paths"\n',
+        # Escape sequences:
+        '[tool.project-paths]\ndocs = "C:\\\\docs"\n',
+        # Not a string:
+        "[tool.project-paths]\nanswer = 42\n",
+        # Dotted keys:
+        '[tool.project-paths]\ndocs.html = "docs/html"\n',
+        # Sub-tables:
+        '[tool.project-paths]\ndocs = "docs/"\n[tool.project-paths.more]\n',
+        # Defined elsewhere:
+        '[tool]\nproject-paths = { docs = "docs/" }\n',
+        '[tool.project-paths]\ndocs = "docs/"\n[tool]\nproject-paths.x = "x"\n',
+        '[tool.project-paths]\ndocs = "d"\n["tool".project-paths.sub]\nx = "y"\n',
+        # Multi-line strings might hide anything:
+        'x = """\n[tool.project-paths]\ndocs = "docs/"\n"""\n',
+        # Invalid TOML:
+        '[tool.project-paths]\ndocs = "docs/"\ndocs = "other/"\n',
+        '[tool.project-paths]\ndocs = "do\x01cs/"\n',
+        '[tool.project-paths]\ndocs = "docs/" # \x7f\n',
+    ],
+)
+def test_scan_table_gives_up(text):
+    """
+    Anything but the simplest tables should be left to the full parser.
+    """
+    assert project_paths._scan_table(text.encode("UTF-8")) is None
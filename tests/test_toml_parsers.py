@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+Note: these tests know about the internal structure of the module.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+import project_paths
+
+
+@pytest.mark.parametrize(
+    "available,expected",
+    [
+        ({"pytomlpp", "tomllib", "tomli", "toml"}, "pytomlpp"),
+        ({"tomllib", "tomli", "toml"}, "tomllib"),
+        ({"tomli", "toml"}, "tomli"),
+        ({"toml"}, "toml"),
+        ({"pytomlpp", "toml"}, "pytomlpp"),
+    ],
+)
+def test_toml_parser_fallback_order(monkeypatch, available, expected):
+    """
+    The fastest available TOML parser should be chosen.
+    """
+
+    def import_module(name):
+        if name not in available:
+            raise ImportError(f"No module named {name!r}")
+        return SimpleNamespace(loads=name)
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    assert project_paths._import_toml_loads() == expected
+
+
+def test_no_toml_parser(monkeypatch):
+    def import_module(name):
+        raise ImportError(f"No module named {name!r}")
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    with pytest.raises(ImportError):
+        project_paths._import_toml_loads()